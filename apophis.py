@@ -10,10 +10,13 @@ from __future__ import annotations
 from pathlib import Path
 
 import ast
+import atexit
 import contextlib
-import io
+import functools
 import json
+import re
 import subprocess
+import threading
 
 import malbolge
 
@@ -24,17 +27,33 @@ __all__ = [
     "run_malbolge",
     "run_file",
     "malbolge_encode",
+    "malbolge_encode_bytes",
     "run_ruby",
     "run_python",
     "run_apophis",
+    "run_apophis_from_file",
     "repl",
     "main",
 ]
 
 
+# Largest program size eligible for result caching; beyond this the cache
+# would mostly hold memory rather than save time.
+_MALBOLGE_CACHE_LIMIT = 4096
+
+
+@functools.lru_cache(maxsize=256)
+def _cached_malbolge(code: str) -> str:
+    return malbolge.eval(code)
+
+
 def run_malbolge(code: str) -> str:
     """Execute *code* written in Malbolge and return its output.
 
+    Malbolge evaluation is deterministic and side-effect free for the
+    programs Apophis runs, so results for short programs are memoised; the
+    REPL and mixed programs re-run identical snippets constantly.
+
     Parameters
     ----------
     code:
@@ -42,6 +61,17 @@ def run_malbolge(code: str) -> str:
     """
     if not isinstance(code, str):
         raise TypeError("code must be a string")
+    return _run_malbolge_unchecked(code)
+
+
+def _run_malbolge_unchecked(code: str) -> str:
+    """Execute Malbolge *code* without re-validating the argument type.
+
+    Internal variant used by the segment dispatcher, which already receives
+    str lines from the parser.
+    """
+    if len(code) <= _MALBOLGE_CACHE_LIMIT:
+        return _cached_malbolge(code)
     return malbolge.eval(code)
 
 
@@ -62,14 +92,46 @@ def run_file(
     file_path = Path(path)
     if file_path.suffix not in {".apop", ".apo"}:
         raise ValueError("Apophis files must use the .apop or .apo extension")
-    code = file_path.read_text(encoding="utf-8")
-    return run_apophis(code, py_env=py_env)
+    st = file_path.stat()
+    segments = _load_segments(str(file_path), st.st_mtime_ns, st.st_size)
+    if py_env is None:
+        py_env = {}
+    # The segment count is known here, so the output list is pre-sized and
+    # filled by index rather than grown append-by-append.
+    outputs = [""] * len(segments)
+    for i, (seg_type, seg_code) in enumerate(segments):
+        outputs[i] = _dispatch_segment(seg_type, seg_code, py_env)
+    return "".join(outputs)
+
+
+@functools.lru_cache(maxsize=64)
+def _load_segments(
+    path_str: str, mtime_ns: int, size: int
+) -> tuple[tuple[str, str], ...]:
+    """Read and segment a source file, cached on its stat signature.
+
+    Re-running an unchanged file skips both the read and segment parsing; the
+    mtime/size key invalidates the entry as soon as the file changes.  The
+    Python segments' compilation is cached separately by
+    :func:`_compile_checked`.
+    """
+    code = Path(path_str).read_bytes().decode("utf-8")
+    return tuple(_iter_segments(code))
 
 
 # Backwards compatibility for earlier versions
 apophis_malbolge = run_file
 
 
+try:
+    # Optional compiled accelerator providing a SIMD translate(data) -> bytes.
+    # The pure-Python build ships without it; bytes.translate is the fallback.
+    from _malbolge_simd import translate as _translate  # type: ignore[import-not-found]
+except ImportError:
+    def _translate(data: bytes) -> bytes:
+        return data.translate(malbolge.ENCRYPT_TABLE)
+
+
 def malbolge_encode(text: str) -> str:
     """Encode *text* using Malbolge's encryption algorithm.
 
@@ -77,14 +139,188 @@ def malbolge_encode(text: str) -> str:
     encryption table defined by the language.  Other characters are left
     unchanged.
     """
-    encoded_chars: list[str] = []
-    for ch in text:
-        o = ord(ch)
-        if 33 <= o <= 126:
-            encoded_chars.append(chr(malbolge.ENCRYPT[o - 33]))
-        else:
-            encoded_chars.append(ch)
-    return "".join(encoded_chars)
+    try:
+        data = text.encode("latin-1")
+    except UnicodeEncodeError:
+        # Code points above 255 cannot take the bytewise fast path; fall back
+        # to the scalar per-character loop for these rare inputs.
+        return "".join(
+            chr(malbolge.ENCRYPT[o - 33]) if 33 <= (o := ord(ch)) <= 126 else ch
+            for ch in text
+        )
+    return _translate(data).decode("latin-1")
+
+
+def malbolge_encode_bytes(data: bytes) -> bytes:
+    """Encode *data* using Malbolge's encryption algorithm.
+
+    Bytes-domain variant of :func:`malbolge_encode` for callers that already
+    hold raw bytes; it skips the str/bytes conversions entirely.
+    """
+    if not isinstance(data, (bytes, bytearray)):
+        raise TypeError("data must be bytes")
+    return _translate(bytes(data))
+
+
+# Bootstrap program for the persistent Ruby worker.  It reads length-framed
+# ``env``/``code`` pairs from stdin, evaluates each snippet in a fresh binding
+# seeded from the env, and answers with a status line followed by framed
+# captured stdout and the JSON-serialisable locals left behind.  Output is
+# captured by reopening STDOUT onto a temp file for the duration of the
+# snippet, so even fd-level writes that bypass ``$stdout`` land in the
+# capture instead of interleaving with the response framing.
+_RUBY_BOOTSTRAP = r"""
+require 'json'
+require 'tempfile'
+
+def __apophis_binding
+  Object.new.instance_eval { binding }
+end
+
+loop do
+  header = STDIN.gets
+  break if header.nil?
+  env = JSON.parse(STDIN.read(header.to_i))
+  code = STDIN.read(STDIN.gets.to_i)
+  b = __apophis_binding
+  env.each { |k, v| b.local_variable_set(k.to_sym, v) }
+  capture = Tempfile.new('apophis-out')
+  saved = STDOUT.dup
+  error = nil
+  begin
+    STDOUT.reopen(capture)
+    eval(code, b)
+  rescue Exception => e
+    error = "#{e.class}: #{e.message}"
+  ensure
+    STDOUT.flush
+    STDOUT.reopen(saved)
+    saved.close
+  end
+  if error
+    tail = error
+  else
+    env_out = {}
+    b.local_variables.each do |v|
+      value = b.local_variable_get(v)
+      begin
+        JSON.generate([value])
+        env_out[v] = value
+      rescue JSON::GeneratorError, SystemStackError
+      end
+    end
+    tail = JSON.generate(env_out)
+  end
+  capture.rewind
+  payload = capture.read
+  capture.close!
+  STDOUT.write("#{error ? 1 : 0}\n")
+  STDOUT.write("#{payload.bytesize}\n")
+  STDOUT.write(payload)
+  STDOUT.write("#{tail.bytesize}\n")
+  STDOUT.write(tail)
+  STDOUT.flush
+end
+"""
+
+
+class _RubyWorkerUnavailable(OSError):
+    """Raised when a request could not be handed to the worker at all.
+
+    Distinguishes pre-execution failures (the snippet provably never ran
+    and may safely be retried elsewhere) from response-side failures,
+    where the snippet may already have executed.
+    """
+
+
+class _RubyWorker:
+    """Long-lived ``ruby`` subprocess executing snippets on demand.
+
+    Spawning a fresh interpreter per segment costs far more than the segments
+    themselves; a single worker amortises MRI startup across every Ruby call
+    in the process.  Each request carries its own environment frame, so one
+    worker can serve all sessions.
+    """
+
+    def __init__(self) -> None:
+        self._proc = subprocess.Popen(
+            ["ruby", "-e", _RUBY_BOOTSTRAP],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+        )
+        self._lock = threading.Lock()
+
+    def alive(self) -> bool:
+        return self._proc.poll() is None
+
+    def run(self, code: str, env: dict[str, object] | None) -> str:
+        env_blob = json.dumps(env or {}).encode("utf-8")
+        code_blob = code.encode("utf-8")
+        with self._lock:
+            stdin = self._proc.stdin
+            stdout = self._proc.stdout
+            try:
+                stdin.write(b"%d\n%s%d\n%s" % (len(env_blob), env_blob, len(code_blob), code_blob))
+                stdin.flush()
+            except OSError as exc:
+                # The frame never reached the worker, so the snippet has
+                # not run; the caller may safely retry it elsewhere.
+                raise _RubyWorkerUnavailable(str(exc)) from exc
+            try:
+                status = stdout.readline()
+                if status not in (b"0\n", b"1\n"):
+                    # Anything else means the framing is corrupt (e.g. the
+                    # snippet exited mid-frame); never guess at a recovery.
+                    raise ValueError(f"bad status line {status!r}")
+                failed = status == b"1\n"
+                output = stdout.read(int(stdout.readline()))
+                tail = stdout.read(int(stdout.readline()))
+            except (OSError, ValueError) as exc:
+                # The frame was delivered, so the snippet may already have
+                # executed and its side effects must not be replayed; the
+                # stream is desynced either way, so kill the worker and
+                # surface the failure instead of retrying.
+                self._proc.terminate()
+                raise subprocess.CalledProcessError(
+                    1,
+                    ["ruby", "-e", code],
+                    stderr=f"ruby worker protocol failure: {exc}",
+                ) from exc
+        if failed:
+            raise subprocess.CalledProcessError(
+                1, ["ruby", "-e", code], stderr=tail.decode("utf-8", "replace")
+            )
+        if env is not None:
+            try:
+                env.update(json.loads(tail))
+            except json.JSONDecodeError:
+                pass
+        return output.decode("utf-8")
+
+    def terminate(self) -> None:
+        with contextlib.suppress(OSError):
+            self._proc.stdin.close()
+        self._proc.terminate()
+
+
+_ruby_worker: _RubyWorker | None = None
+_ruby_worker_failed = False
+
+
+def _get_ruby_worker() -> _RubyWorker | None:
+    """Return the shared Ruby worker, starting it on first use."""
+    global _ruby_worker, _ruby_worker_failed
+    if _ruby_worker is not None and _ruby_worker.alive():
+        return _ruby_worker
+    if _ruby_worker_failed:
+        return None
+    try:
+        _ruby_worker = _RubyWorker()
+    except OSError:
+        _ruby_worker_failed = True
+        return None
+    atexit.register(_ruby_worker.terminate)
+    return _ruby_worker
 
 
 def run_ruby(code: str, env: dict[str, object] | None = None) -> str:
@@ -94,10 +330,29 @@ def run_ruby(code: str, env: dict[str, object] | None = None) -> str:
     from the mapping are injected into the Ruby interpreter before *code*
     executes.  After execution, any Ruby variables are written back to ``env`` to
     allow rudimentary state sharing with Python segments.
+
+    Snippets run on a shared long-lived ``ruby`` worker process so repeated
+    segments do not pay interpreter startup each time; if the worker cannot be
+    started, each call falls back to a one-shot ``ruby -e`` subprocess.
     """
     if not isinstance(code, str):
         raise TypeError("code must be a string")
 
+    worker = _get_ruby_worker()
+    if worker is not None:
+        try:
+            return worker.run(code, env)
+        except _RubyWorkerUnavailable:
+            # The snippet never reached the worker, so re-running it in a
+            # one-shot interpreter cannot duplicate side effects.  Failures
+            # after delivery propagate instead: the snippet may already
+            # have executed.
+            worker.terminate()
+    return _run_ruby_subprocess(code, env)
+
+
+def _run_ruby_subprocess(code: str, env: dict[str, object] | None = None) -> str:
+    """One-shot ``ruby -e`` execution used when the worker is unavailable."""
     preamble = ""
     postamble = ""
     if env is not None:
@@ -112,20 +367,46 @@ def run_ruby(code: str, env: dict[str, object] | None = None) -> str:
         )
 
     full_code = preamble + code + postamble
+    # Binary pipes avoid the universal-newline and incremental UTF-8 layers of
+    # text mode; only the streams actually consumed get decoded.
     proc = subprocess.run(
         ["ruby", "-e", full_code],
         check=True,
-        text=True,
         capture_output=True,
     )
     if env is not None:
         try:
-            env.update(json.loads(proc.stderr or "{}"))
+            env.update(json.loads(proc.stderr or b"{}"))
         except json.JSONDecodeError:
             pass
-    return proc.stdout
-
-
+    return proc.stdout.decode("utf-8")
+
+
+# Precompiled rewrites for the Ruby-like syntax subset: drop bare ``end``
+# lines, map bare ``next`` to ``continue`` and normalise block headers in a
+# single pass each through CPython's C-implemented regex engine.
+_END_RE = re.compile(r"(?m)^\s*end\s*$\n?")
+_NEXT_RE = re.compile(r"(?m)^(\s*)next\s*$")
+_HEADER_RE = re.compile(
+    r"(?m)^(?P<indent>\s*)(?P<kw>elsif|unless|until|if|while|elif|else|for|def)\b(?P<rest>.*)$"
+)
+_KEYWORD_MAP = {"elsif": "elif", "unless": "if not", "until": "while not"}
+
+
+def _fix_header(match: re.Match[str]) -> str:
+    """Rewrite one block header: map the keyword, drop ``do``/``then``, add ``:``."""
+    keyword = match.group("kw")
+    header = (_KEYWORD_MAP.get(keyword, keyword) + match.group("rest")).rstrip()
+    if header.endswith(" do"):
+        header = header[:-3].rstrip()
+    if header.endswith(" then"):
+        header = header[:-5].rstrip()
+    if not header.endswith(":"):
+        header += ":"
+    return match.group("indent") + header
+
+
+@functools.lru_cache(maxsize=512)
 def _ruby_to_python(code: str) -> str:
     """Translate a tiny Ruby-like syntax subset into valid Python code.
 
@@ -135,36 +416,99 @@ def _ruby_to_python(code: str) -> str:
     Ruby-to-Python converter.
     """
 
-    lines: list[str] = []
-    for line in code.splitlines():
-        stripped = line.strip()
-        if stripped == "end":
-            continue
-        if stripped == "next":
-            lines.append(line.replace("next", "continue", 1))
-            continue
-        first_word = stripped.split(" ", 1)[0] if stripped else ""
-        if first_word == "elsif":
-            line = line.replace("elsif", "elif", 1)
-            first_word = "elif"
-        elif first_word == "unless":
-            line = line.replace("unless", "if not", 1)
-            first_word = "if"
-        elif first_word == "until":
-            line = line.replace("until", "while not", 1)
-            first_word = "while"
-        stripped = line.strip()
-        if first_word in {"if", "while", "elif", "else", "def", "for"}:
-            if stripped.endswith(" do"):
-                line = line[: line.rfind(" do")]
-                stripped = line.strip()
-            if stripped.endswith(" then"):
-                line = line[: line.rfind(" then")]
-                stripped = line.strip()
-            if not stripped.endswith(":"):
-                line = line.rstrip() + ":"
-        lines.append(line)
-    return "\n".join(lines)
+    code = _END_RE.sub("", code)
+    code = _NEXT_RE.sub(r"\1continue", code)
+    return _HEADER_RE.sub(_fix_header, code)
+
+
+# AST node types accepted by the restricted Python subset.  Frozen at module
+# scope so validation does not rebuild the collection on every call.
+_ALLOWED_NODES = (
+    ast.Module,
+    ast.Assign,
+    ast.Expr,
+    ast.Call,
+    ast.Name,
+    ast.Load,
+    ast.Store,
+    ast.keyword,
+    ast.Constant,
+    ast.BinOp,
+    ast.Add,
+    ast.Sub,
+    ast.Mult,
+    ast.Div,
+    ast.Pow,
+    ast.Mod,
+    ast.If,
+    ast.While,
+    ast.For,
+    ast.List,
+    ast.Tuple,
+    ast.FunctionDef,
+    ast.arguments,
+    ast.arg,
+    ast.Return,
+    ast.Compare,
+    ast.Eq,
+    ast.NotEq,
+    ast.Lt,
+    ast.LtE,
+    ast.Gt,
+    ast.GtE,
+    ast.BoolOp,
+    ast.And,
+    ast.Or,
+    ast.UnaryOp,
+    ast.UAdd,
+    ast.USub,
+    ast.Not,
+    ast.Break,
+    ast.Continue,
+    ast.Pass,
+)
+
+# Node-type names of _ALLOWED_NODES for O(1) membership checks during the
+# validation visit.
+_ALLOWED_NAMES = frozenset(cls.__name__ for cls in _ALLOWED_NODES)
+
+# Builtins exposed to the restricted subset that carry no per-call state.
+# print/puts/ruby close over the call's output buffer and environment, so
+# they are added per execution on top of this template.
+_STATIC_BUILTINS = {"range": range}
+
+
+class _Validator(ast.NodeVisitor):
+    """Reject the first AST node outside the allowed subset."""
+
+    def generic_visit(self, node: ast.AST) -> None:
+        name = type(node).__name__
+        if name not in _ALLOWED_NAMES:
+            raise ValueError(f"Unsupported syntax: {name}")
+        super().generic_visit(node)
+
+
+# Shapes common enough at the REPL to deserve skipping the validation walk:
+# a numeric-literal assignment and a bare print/puts of one variable.  Both
+# consist solely of allowed nodes by construction.
+_FAST_ASSIGN = re.compile(r"^\s*[A-Za-z_]\w*\s*=\s*[-+]?\d+(\.\d*)?\s*$")
+_FAST_PRINT = re.compile(r"^\s*p(?:rint|uts)\(\s*[A-Za-z_]\w*\s*\)\s*$")
+
+
+@functools.lru_cache(maxsize=512)
+def _compile_checked(code: str):
+    """Parse, validate and compile *code*, caching the resulting code object.
+
+    REPL sessions and mixed programs re-execute identical snippets; caching
+    amortises the parse + allow-list walk + compile to one pass per unique
+    source.  Rejected sources raise :class:`ValueError` on every call because
+    ``lru_cache`` does not cache exceptions.
+    """
+    if _FAST_ASSIGN.match(code) or _FAST_PRINT.match(code):
+        return compile(code, "<apophis>", "exec")
+    tree = ast.parse(code, mode="exec")
+    _Validator().visit(tree)
+    return compile(tree, "<apophis>", "exec")
 
 
 def run_python(code: str, env: dict[str, object] | None = None) -> str:
@@ -189,69 +533,98 @@ def run_python(code: str, env: dict[str, object] | None = None) -> str:
 
     if not isinstance(code, str):
         raise TypeError("code must be a string")
+    return _run_python_unchecked(code, env)
+
 
+def _run_python_unchecked(code: str, env: dict[str, object] | None = None) -> str:
+    """Execute restricted Python *code* without re-validating the argument type.
+
+    Internal variant used by the segment dispatcher, which already receives
+    str lines from the parser.
+    """
     code = _ruby_to_python(code)
-    tree = ast.parse(code, mode="exec")
-    allowed_nodes = (
-        ast.Module,
-        ast.Assign,
-        ast.Expr,
-        ast.Call,
-        ast.Name,
-        ast.Load,
-        ast.Store,
-        ast.keyword,
-        ast.Constant,
-        ast.BinOp,
-        ast.Add,
-        ast.Sub,
-        ast.Mult,
-        ast.Div,
-        ast.Pow,
-        ast.Mod,
-        ast.If,
-        ast.While,
-        ast.For,
-        ast.List,
-        ast.Tuple,
-        ast.FunctionDef,
-        ast.arguments,
-        ast.arg,
-        ast.Return,
-        ast.Compare,
-        ast.Eq,
-        ast.NotEq,
-        ast.Lt,
-        ast.LtE,
-        ast.Gt,
-        ast.GtE,
-        ast.BoolOp,
-        ast.And,
-        ast.Or,
-        ast.UnaryOp,
-        ast.UAdd,
-        ast.USub,
-        ast.Not,
-        ast.Break,
-        ast.Continue,
-        ast.Pass,
-    )
-    for node in ast.walk(tree):
-        if not isinstance(node, allowed_nodes):
-            raise ValueError(f"Unsupported syntax: {type(node).__name__}")
+    code_obj = _compile_checked(code)
 
     if env is None:
         env = {}
-    buf = io.StringIO()
+
+    # Collect output directly instead of redirecting sys.stdout through a
+    # StringIO; the restricted subset can only emit text via print/puts.
+    chunks: list[str] = []
+
+    def _print(*args: object, sep: str = " ", end: str = "\n", **_kwargs: object) -> None:
+        chunks.append(sep.join(map(str, args)))
+        chunks.append(end)
+
     def ruby(code_str: str) -> None:
         output = run_ruby(code_str, env=env)
         if output:
-            print(output, end="")
+            chunks.append(output)
+
+    builtins = dict(_STATIC_BUILTINS)
+    builtins.update(print=_print, puts=_print, ruby=ruby)
+    globals_dict = {"__builtins__": builtins}
+    exec(code_obj, globals_dict, env)
+    return "".join(chunks)
+
 
-    globals_dict = {"__builtins__": {"print": print, "puts": print, "range": range, "ruby": ruby}}
-    with contextlib.redirect_stdout(buf):
-        exec(compile(tree, "<apophis>", "exec"), globals_dict, env)
-    return buf.getvalue()
+# First-character dispatch for segment classification.  Only lines whose
+# marker sits in column 0 switch language; anything else is Malbolge.
+_LINE_DISPATCH = {":": "py", ";": "rb"}
+
+
+def _iter_segments(code: str):
+    """Yield ``(seg_type, seg_code)`` pairs from mixed Apophis *code*."""
+    return _iter_segment_lines(code.splitlines())
+
+
+def _iter_segment_lines(lines):
+    """Yield ``(seg_type, seg_code)`` pairs from an iterable of source lines.
+
+    A single pass over the source classifies each line, strips the ``:``/``;``
+    prefixes and joins a segment's lines exactly once as it is yielded, so no
+    intermediate segment list is materialised.  Blank and comment lines are
+    dropped before the segment-boundary check, so Python blocks separated only
+    by comments coalesce into one segment and compile (and cache) as a unit.
+    Lines must arrive without their trailing newlines.
+    """
+    current_type: str | None = None
+    buffer: list[str] = []
+    for raw_line in lines:
+        if not raw_line:
+            continue
+        first = raw_line[0]
+        if first == "#":
+            continue
+        seg_type = _LINE_DISPATCH.get(first)
+        if seg_type is not None:
+            line = raw_line[1:]
+        else:
+            if first.isspace():
+                stripped = raw_line.lstrip()
+                if not stripped or stripped[0] == "#":
+                    continue
+            seg_type = "mb"
+            line = raw_line
+        if seg_type != current_type:
+            if buffer:
+                yield current_type, "\n".join(buffer)
+                buffer = []
+            current_type = seg_type
+        buffer.append(line)
+    if buffer:
+        yield current_type, "\n".join(buffer)
+
+
+def _dispatch_segment(seg_type: str, seg_code: str, py_env: dict[str, object]) -> str:
+    """Execute one parsed segment and return its output."""
+    if not seg_code.strip():
+        return ""
+    if seg_type == "py":
+        return _run_python_unchecked(seg_code, env=py_env)
+    if seg_type == "rb":
+        return run_ruby(seg_code, env=py_env)
+    return _run_malbolge_unchecked(seg_code)
 
 
 def run_apophis(code: str, py_env: dict[str, object] | None = None) -> str:
@@ -270,46 +643,54 @@ def run_apophis(code: str, py_env: dict[str, object] | None = None) -> str:
     if not isinstance(code, str):
         raise TypeError("code must be a string")
 
-    segments: list[tuple[str, str]] = []
-    current_type: str | None = None
-    buffer: list[str] = []
-    for raw_line in code.splitlines():
-        stripped = raw_line.lstrip()
-        if not stripped or stripped.startswith("#"):
-            continue
-        if raw_line.startswith(":"):
-            seg_type = "py"
-            line = raw_line[1:]
-        elif raw_line.startswith(";"):
-            seg_type = "rb"
-            line = raw_line[1:]
-        else:
-            seg_type = "mb"
-            line = raw_line
-        if current_type is None:
-            current_type = seg_type
-        if seg_type != current_type:
-            segments.append((current_type, "\n".join(buffer)))
-            buffer = []
-            current_type = seg_type
-        buffer.append(line)
-    if buffer:
-        segments.append((current_type, "\n".join(buffer)))
+    if py_env is None:
+        py_env = {}
+
+    return "".join(
+        [
+            _dispatch_segment(seg_type, seg_code, py_env)
+            for seg_type, seg_code in _parse_segments_cached(code)
+        ]
+    )
+
+
+def run_apophis_from_file(file, py_env: dict[str, object] | None = None) -> str:
+    """Execute mixed Apophis source read incrementally from a file object.
+
+    Streaming counterpart of :func:`run_apophis` for callers whose source
+    already lives in a file-like object (open file, spooled temporary
+    file).  Lines are consumed one at a time and segments dispatched as
+    they complete, so the whole program is never materialised as a single
+    string.  Because there is no string key, results bypass the parse
+    cache used by :func:`run_apophis`.
 
+    Parameters
+    ----------
+    file:
+        An iterable of text lines, such as an open text-mode file.
+    py_env:
+        Optional environment dictionary shared by Python and Ruby segments.
+    """
     if py_env is None:
         py_env = {}
+    return "".join(
+        _dispatch_segment(seg_type, seg_code, py_env)
+        for seg_type, seg_code in _iter_segment_lines(
+            line.rstrip("\r\n") for line in file
+        )
+    )
 
-    outputs: list[str] = []
-    for seg_type, seg_code in segments:
-        if not seg_code.strip():
-            continue
-        if seg_type == "py":
-            outputs.append(run_python(seg_code, env=py_env))
-        elif seg_type == "rb":
-            outputs.append(run_ruby(seg_code, env=py_env))
-        else:
-            outputs.append(run_malbolge(seg_code))
-    return "".join(outputs)
+
+@functools.lru_cache(maxsize=8)
+def _parse_segments_cached(code: str) -> tuple[tuple[str, str], ...]:
+    """Segment mixed source, keeping the last few parses.
+
+    An IDE or REPL re-runs the same buffer repeatedly with at most small
+    edits between runs; a shallow LRU means unchanged re-runs skip the
+    line scan and go straight to dispatch, where the compile and Malbolge
+    caches already make repeat execution cheap.
+    """
+    return tuple(_iter_segments(code))
 
 
 def repl(input_func=input, output_func=print) -> None:
@@ -15,8 +15,12 @@ basic unit testing.
 """
 from __future__ import annotations
 
+from collections import deque
+from contextlib import contextmanager
+from functools import partial, wraps
 from pathlib import Path
-import contextlib
+import os
+import queue
 import threading
 from tkinter import (
     Tk,
@@ -24,14 +28,63 @@ from tkinter import (
     Menu,
     END,
     INSERT,
+    IntVar,
     Label,
+    TclError,
     filedialog,
     messagebox,
     simpledialog,
 )
 from tkinter.scrolledtext import ScrolledText
 
-import apophis
+# Persistent list of recently opened files, newest first.
+RECENT_STORE = Path.home() / ".apophis_recent"
+RECENT_LIMIT = 10
+
+# Menu layouts replayed by _create_menu; entries are (label, method name)
+# pairs with None marking a separator.
+_FILE_MENU_SPEC = (
+    ("New", "new_file"),
+    ("Open", "open_file"),
+    ("Save", "save_file"),
+    ("Save As", "save_file_as"),
+    None,
+    ("Exit", "on_close"),
+)
+_RUN_MENU_SPEC = (
+    ("Run", "run_code"),
+    ("Clear Output", "clear_output"),
+)
+
+
+# Contents of previously opened files keyed by path, invalidated by the
+# file's stat signature.  Reopening an unchanged file costs one stat call
+# instead of a read plus UTF-8 decode.
+_FILE_CACHE: dict[str, tuple[int, int, str]] = {}
+
+
+def _read_file_cached(path: Path) -> str:
+    """Return the text of *path*, reusing the cache while its stat matches."""
+    path_str = str(path)
+    fd = os.open(path_str, os.O_RDONLY | getattr(os, "O_CLOEXEC", 0))
+    try:
+        st = os.fstat(fd)
+        cached = _FILE_CACHE.get(path_str)
+        if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            return cached[2]
+        chunks: list[bytes] = []
+        remaining = st.st_size
+        while remaining > 0:
+            chunk = os.read(fd, remaining)
+            if not chunk:
+                break
+            chunks.append(chunk)
+            remaining -= len(chunk)
+    finally:
+        os.close(fd)
+    text = b"".join(chunks).decode("utf-8")
+    _FILE_CACHE[path_str] = (st.st_mtime_ns, st.st_size, text)
+    return text
 
 
 class ApophisIDE:
@@ -41,10 +94,53 @@ class ApophisIDE:
         self.root = Tk()
         self.file_path: Path | None = None
         self.modified = False
-        self.text = Text(self.root, wrap="none", undo=True)
+        # Oldest output lines are dropped beyond this cap so long-running
+        # programs cannot grow the console (and its insert cost) unboundedly.
+        self._output_cap = 5000
+        self._out_queue: deque[str] = deque()
+        self._out_flush_scheduled = False
+        self._status_pending = False
+        self._last_pos = ""
+        self._fmt_status = "Ln {}, Col {}".format
+        self.recent_files: list[Path] = []
+        self._recent_disk_state: tuple[str, ...] = ()
+        # Mirror of the Open Recent menu's current order, used to diff
+        # updates instead of rebuilding the menu from scratch.
+        self._menu_items: list[Path] = []
+        self._load_recent_files()
+        self._last_find: str | None = None
+        # Single long-lived daemon worker so Run and Save never block the Tk
+        # thread and queued jobs execute FIFO without per-job thread startup.
+        # Jobs are ("run", code) or ("save", path, content) tuples; results
+        # come back via a queue drained on the Tk side by a timer.
+        self._jobs: queue.Queue[tuple] = queue.Queue()
+        self._results: queue.Queue[str] = queue.Queue()
+        # Save payloads awaiting the worker, keyed by a monotonically
+        # increasing token.  The lock guards both structures because the Tk
+        # thread registers entries while the worker (or the closing flush)
+        # claims them; whoever claims a token owns its write.  A claimed
+        # token moves to _claimed_saves until its write lands, so on_close
+        # can tell an in-flight save from a finished one; the condition is
+        # notified as each write completes.
+        self._pending_saves: dict[int, tuple[Path, str]] = {}
+        self._claimed_saves: set[int] = set()
+        self._save_lock = threading.Lock()
+        self._save_done = threading.Condition(self._save_lock)
+        self._save_seq = 0
+        threading.Thread(target=self._run_worker, daemon=True).start()
+        self.root.after(50, self._pump_results)
+        # maxundo bounds the undo stack so week-long sessions cannot grow
+        # edit history without limit; oldest entries evict first.
+        self.text = Text(self.root, wrap="none", undo=True, maxundo=1000)
         self.output = ScrolledText(self.root, wrap="word", height=8, state="disabled")
         self.status = Label(self.root, anchor="w")
 
+        self.text.tag_config("hit", background="yellow")
+        # Bound once so held-key undo/redo storms skip the per-event
+        # attribute lookups on self.text.
+        self._edit_undo = self.text.edit_undo
+        self._edit_redo = self.text.edit_redo
+
         self.status.pack(fill="x", side="bottom")
         self.output.pack(fill="x", side="bottom")
         self.text.pack(fill="both", expand=True)
@@ -56,44 +152,47 @@ class ApophisIDE:
         self.text.edit_modified(False)
         self.text.bind("<<Modified>>", self._on_modified)
         self.root.protocol("WM_DELETE_WINDOW", self.on_close)
+        # Warm the interpreter import while the window paints so the first
+        # Run pays a sys.modules lookup instead of the module load.
+        threading.Thread(target=self._warm_import, daemon=True).start()
 
     # GUI setup ---------------------------------------------------------
     def _create_menu(self) -> None:
         menu_bar = Menu(self.root)
         file_menu = Menu(menu_bar, tearoff=0)
-        file_menu.add_command(label="New", command=self.new_file)
-        file_menu.add_command(label="Open", command=self.open_file)
-        file_menu.add_command(label="Save", command=self.save_file)
-        file_menu.add_command(label="Save As", command=self.save_file_as)
-        file_menu.add_separator()
-        file_menu.add_command(label="Exit", command=self.on_close)
+        for entry in _FILE_MENU_SPEC:
+            if entry is None:
+                file_menu.add_separator()
+            else:
+                label, method = entry
+                file_menu.add_command(label=label, command=getattr(self, method))
+                if method == "open_file":
+                    self.recent_menu = Menu(file_menu, tearoff=0)
+                    file_menu.add_cascade(label="Open Recent", menu=self.recent_menu)
         menu_bar.add_cascade(label="File", menu=file_menu)
+        self._update_recent_menu()
 
         edit_menu = Menu(menu_bar, tearoff=0)
         edit_menu.add_command(label="Undo", command=self.undo)
         edit_menu.add_command(label="Redo", command=self.redo)
         edit_menu.add_separator()
-        edit_menu.add_command(
-            label="Cut", command=lambda: self.text.event_generate("<<Cut>>")
-        )
-        edit_menu.add_command(
-            label="Copy", command=lambda: self.text.event_generate("<<Copy>>")
-        )
-        edit_menu.add_command(
-            label="Paste", command=lambda: self.text.event_generate("<<Paste>>")
-        )
-        edit_menu.add_command(
-            label="Select All",
-            command=lambda: self.text.event_generate("<<SelectAll>>"),
-        )
+        for label, event in (
+            ("Cut", "<<Cut>>"),
+            ("Copy", "<<Copy>>"),
+            ("Paste", "<<Paste>>"),
+            ("Select All", "<<SelectAll>>"),
+        ):
+            edit_menu.add_command(
+                label=label, command=partial(self.text.event_generate, event)
+            )
         edit_menu.add_separator()
         edit_menu.add_command(label="Find", command=self.find_text)
         edit_menu.add_command(label="Replace", command=self.replace_text)
         menu_bar.add_cascade(label="Edit", menu=edit_menu)
 
         run_menu = Menu(menu_bar, tearoff=0)
-        run_menu.add_command(label="Run", command=self.run_code)
-        run_menu.add_command(label="Clear Output", command=self.clear_output)
+        for label, method in _RUN_MENU_SPEC:
+            run_menu.add_command(label=label, command=getattr(self, method))
         menu_bar.add_cascade(label="Run", menu=run_menu)
 
         self.root.config(menu=menu_bar)
@@ -104,6 +203,8 @@ class ApophisIDE:
         if not self.maybe_save():
             return
         self.text.delete("1.0", END)
+        if not self.text.cget("undo"):
+            self.text.configure(undo=True)
         self.file_path = None
         self.modified = False
         self.update_title()
@@ -118,21 +219,200 @@ class ApophisIDE:
         )
         if path:
             self.file_path = Path(path)
+            self._load_into_text(self.file_path)
+            self._add_recent_file(self.file_path)
+
+    def open_recent_file(self, path: Path) -> None:
+        """Open *path* from the recent-files menu."""
+        if not self.maybe_save():
+            return
+        if not path.exists():
+            self.recent_files.remove(path)
+            self._save_recent_files()
+            self._update_recent_menu()
+            return
+        self.file_path = path
+        self._load_into_text(path)
+        self._add_recent_file(path)
+
+    # Recent files ------------------------------------------------------
+    def _load_recent_files(self) -> None:
+        # The stored list is trusted as-is: stat-ing every entry here would
+        # put up to RECENT_LIMIT syscalls on the UI thread before the first
+        # frame (painful on network homes).  Vanished files are pruned by a
+        # background thread and again lazily on click.
+        try:
+            lines = RECENT_STORE.read_text(encoding="utf-8").splitlines()
+        except OSError:
+            lines = []
+        self.recent_files = [Path(p) for p in lines if p.strip()][:RECENT_LIMIT]
+        self._recent_disk_state = tuple(str(p) for p in self.recent_files)
+        if self.recent_files:
+            threading.Thread(target=self._prune_recent, daemon=True).start()
+
+    def _prune_recent(self) -> None:  # pragma: no cover - background thread
+        """Drop recent entries whose files no longer exist.
+
+        The stat calls run off the UI thread; the list and menu update is
+        marshalled back through ``after`` so Tk state is only touched from
+        the Tk thread.
+        """
+        snapshot = list(self.recent_files)
+        dead = {p for p in snapshot if not p.exists()}
+        if not dead:
+            return
+
+        def apply() -> None:
+            self.recent_files = [p for p in self.recent_files if p not in dead]
+            self._save_recent_files()
+            self._update_recent_menu()
+
+        self.root.after(0, apply)
+
+    def _save_recent_files(self) -> None:
+        # Most opens/saves leave the list unchanged (the file is already at
+        # the top); skip the disk write entirely in that case.
+        current = tuple(str(p) for p in self.recent_files)
+        if current == self._recent_disk_state:
+            return
+        # Pre-encode and write through raw descriptors: one open, one write,
+        # one close, skipping the TextIOWrapper/buffering stack Path.write_text
+        # builds for what is at most a few hundred bytes.  0o600 because the
+        # list leaks the user's file names.
+        data = "\n".join(current).encode("utf-8")
+        tmp = RECENT_STORE.with_name(RECENT_STORE.name + ".tmp")
+        try:
+            fd = os.open(str(tmp), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            try:
+                os.write(fd, data)
+            finally:
+                os.close(fd)
+            os.replace(tmp, RECENT_STORE)
+        except OSError:
+            return
+        self._recent_disk_state = current
+
+    def _add_recent_file(self, path: Path) -> None:
+        if path in self.recent_files:
+            self.recent_files.remove(path)
+        self.recent_files.insert(0, path)
+        del self.recent_files[RECENT_LIMIT:]
+        self._save_recent_files()
+        self._update_recent_menu()
+
+    def _update_recent_menu(self) -> None:
+        """Bring the Open Recent menu in line with ``self.recent_files``.
+
+        The list changes by at most one entry per open/save (promotion to
+        the top) or loses entries on a prune, so those deltas are applied
+        with one or two Tcl calls each; anything else falls back to a full
+        rebuild.
+        """
+        new = self.recent_files
+        old = self._menu_items
+        if new == old:
+            return
+        if new:
+            # Promotion of one path to the top: delete its old row (if
+            # listed) and insert it at index 0, trimming any tail overflow.
+            head = new[0]
+            survivors = [p for p in old if p != head]
+            if new[1:] == survivors[: len(new) - 1]:
+                if head in old:
+                    self.recent_menu.delete(old.index(head))
+                self.recent_menu.insert_command(
+                    0, label=str(head), command=partial(self.open_recent_file, head)
+                )
+                for _ in range(1 + len(survivors) - len(new)):
+                    self.recent_menu.delete(len(new))
+                self._menu_items = list(new)
+                return
+        # Pure removals (background prune, dead entry clicked).
+        kept = set(new)
+        if [p for p in old if p in kept] == new:
+            for i in range(len(old) - 1, -1, -1):
+                if old[i] not in kept:
+                    self.recent_menu.delete(i)
+            self._menu_items = list(new)
+            return
+        self._rebuild_recent_menu()
+
+    def _rebuild_recent_menu(self) -> None:
+        self.recent_menu.delete(0, END)
+        for path in self.recent_files:
+            self.recent_menu.add_command(
+                label=str(path), command=partial(self.open_recent_file, path)
+            )
+        self._menu_items = list(self.recent_files)
+
+    def _load_into_text(self, path: Path) -> None:
+        """Load *path* into the editor and reset modification state.
+
+        Shared by every open path so they all get the cached read, the
+        chunked undo-free insert and consistent title/status handling.
+        Buffers beyond _LARGE_BUFFER trade editing comfort for interactivity:
+        undo stays off and a fixed-width font keeps Tk's line-metric work
+        constant per character.
+        """
+        content = _read_file_cached(path)
+        if len(content) > self._LARGE_BUFFER:
+            self.text.configure(undo=False, font=("TkFixedFont", 10))
+        elif not self.text.cget("undo"):
+            self.text.configure(undo=True)
+        self._load_buffer(content)
+        self.modified = False
+        self.update_title()
+        self.text.edit_modified(False)
+        self.update_status_bar()
+
+    def _load_buffer(self, content: str) -> None:
+        """Replace the editor contents without building undo records.
+
+        Recording the load on the undo stack would shadow-copy the whole
+        file; undo bookkeeping is suspended for the bulk insert and the
+        stack reset afterwards so the load is not undoable.  <<Modified>>
+        is unbound for the duration as well, so the delete and every
+        inserted chunk skip the callback round-trip; the flag is cleared
+        before the handler comes back.
+        """
+        undo_was = self.text.cget("undo")
+        self.text.configure(undo=False, autoseparators=False)
+        self.text.unbind("<<Modified>>")
+        try:
             self.text.delete("1.0", END)
-            self.text.insert(END, self.file_path.read_text(encoding="utf-8"))
-            self.modified = False
-            self.update_title()
+            self._insert_content(content)
+        finally:
+            self.text.configure(undo=undo_was, autoseparators=True)
+            self.text.edit_reset()
             self.text.edit_modified(False)
-            self.update_status_bar()
+            self.text.bind("<<Modified>>", self._on_modified)
+
+    # Inserts above this size are split so the GUI can repaint between
+    # chunks while Tk lays out a large document.
+    _INSERT_CHUNK = 1 << 20
+
+    # Buffers above this size are opened in a reduced-feature mode (no undo,
+    # fixed-width font) to keep editing and scrolling interactive.
+    _LARGE_BUFFER = 1 << 20
+
+    def _insert_content(self, content: str) -> None:
+        """Insert *content* at the end of the editor, chunked when large."""
+        if len(content) <= self._INSERT_CHUNK:
+            self.text.insert(END, content)
+            return
+        for i in range(0, len(content), self._INSERT_CHUNK):
+            self.text.insert(END, content[i : i + self._INSERT_CHUNK])
+            self.text.update_idletasks()
 
     def save_file(self) -> None:
         if self.file_path is None:
             self.save_file_as()
             return
-        self.file_path.write_text(self.text.get("1.0", END), encoding="utf-8")
-        self.modified = False
-        self.text.edit_modified(False)
-        self.update_title()
+        # Saving an untouched buffer is a no-op; skip the buffer dump and the
+        # whole write syscall chain.
+        if not self.modified and not self.text.edit_modified():
+            return
+        self._write_file()
 
     def save_file_as(self) -> None:
         path = filedialog.asksaveasfilename(
@@ -141,23 +421,151 @@ class ApophisIDE:
         )
         if path:
             self.file_path = Path(path)
-            self.save_file()
+            self._write_file()
+
+    def _write_file(self) -> None:
+        """Hand the buffer to the worker thread and mark it clean.
+
+        The Tk thread only snapshots the buffer and queues the job; the
+        disk write happens on the worker so a multi-megabyte save to a
+        slow disk never stalls the event loop.  The buffer is marked clean
+        immediately since the queued snapshot is what will land on disk;
+        a failed write re-dirties it through :meth:`_save_failed`.
+        """
+        content = self.text.get("1.0", END)
+        with self._save_lock:
+            self._save_seq += 1
+            token = self._save_seq
+            self._pending_saves[token] = (self.file_path, content)
+        self._jobs.put(("save", token))
+        self.modified = False
+        self.text.edit_modified(False)
+        self.update_title()
+        self._add_recent_file(self.file_path)
+
+    @staticmethod
+    def _write_file_job(path: Path, content: str, token: int) -> None:
+        """Write *content* to *path* atomically.
+
+        The bytes go to a sibling tmp file which is renamed over the
+        target, so a crash mid-write leaves the previous save intact.  The
+        tmp name carries the save token so no two writes -- the worker's
+        and the closing flush's -- can ever share a tmp file.
+        """
+        data = content.encode("utf-8")
+        tmp = path.with_name(f"{path.name}.{token}.tmp")
+        fd = os.open(str(tmp), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            os.write(fd, data)
+            # The saved bytes are already held by the Text widget and the
+            # read cache, so tell the kernel not to keep them cached at the
+            # expense of hotter pages.  DONTNEED only applies to clean
+            # pages, hence the fsync first (which the rename wants anyway).
+            os.fsync(fd)
+            if hasattr(os, "posix_fadvise"):
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+            st = os.fstat(fd)
+        finally:
+            os.close(fd)
+        os.replace(tmp, path)
+        # Seed the read cache with what was just written so reopening the
+        # file after a save is a stat call rather than a fresh read.
+        _FILE_CACHE[str(path)] = (st.st_mtime_ns, st.st_size, content)
+
+    def _save_failed(self, path: Path, error: str) -> None:
+        """Restore the dirty state after a failed save (Tk thread).
+
+        The buffer was optimistically marked clean when the save was
+        queued; without this, ``maybe_save`` would let the user close the
+        window and silently lose the unsaved edits.
+        """
+        if path == self.file_path:
+            self.modified = True
+            self.text.edit_modified(True)
+            self.update_title()
+        self._write_output(f"Error saving {path}: {error}\n")
 
     # Execution --------------------------------------------------------
+    def _get_code(self) -> str:
+        """Return the buffer without the artificial newline Text.get appends."""
+        return self.text.get("1.0", "end-1c")
+
     def run_code(self) -> None:
         """Run the buffer contents without blocking the UI."""
-        code = self.text.get("1.0", END)
-
-        def worker() -> None:
+        self._jobs.put(("run", self._get_code()))
+
+    @staticmethod
+    def _warm_import() -> None:  # pragma: no cover - background thread
+        try:
+            import apophis  # noqa: F401
+        except Exception:
+            # A broken interpreter install reports properly on first Run.
+            pass
+
+    @staticmethod
+    def _execute(code: str) -> str:
+        # Imported lazily so the window can appear (and programmatic users
+        # can instantiate the class) without loading the whole interpreter;
+        # after the first run this is a sys.modules lookup.
+        import apophis
+
+        if len(code) > ApophisIDE._LARGE_BUFFER:
+            # Spool large buffers to a temporary file and stream them so
+            # the interpreter never holds a second full copy of the source
+            # alongside the snapshot (worker thread, so the spill to disk
+            # cannot stall the UI).
+            import tempfile
+
+            with tempfile.SpooledTemporaryFile(
+                max_size=1 << 20, mode="w+", encoding="utf-8"
+            ) as spool:
+                spool.write(code)
+                del code
+                spool.seek(0)
+                return apophis.run_apophis_from_file(spool)
+        return apophis.run_apophis(code)
+
+    def _run_worker(self) -> None:  # pragma: no cover - background thread
+        while True:
+            job = self._jobs.get()
+            if job[0] == "save":
+                with self._save_lock:
+                    payload = self._pending_saves.pop(job[1], None)
+                    if payload is not None:
+                        self._claimed_saves.add(job[1])
+                if payload is None:
+                    continue  # already claimed by the closing flush
+                path, content = payload
+                try:
+                    self._write_file_job(path, content, job[1])
+                except OSError as exc:
+                    self.root.after(0, partial(self._save_failed, path, str(exc)))
+                finally:
+                    with self._save_done:
+                        self._claimed_saves.discard(job[1])
+                        self._save_done.notify_all()
+                continue
+            _, code = job
             try:
-                output = apophis.run_apophis(code)
+                output = self._execute(code)
                 if output and not output.endswith("\n"):
                     output += "\n"
-            except Exception as exc:  # pragma: no cover - GUI only
+            except Exception as exc:
                 output = f"Error: {exc}\n"
-            self.root.after(0, lambda: self._write_output(output))
-
-        threading.Thread(target=worker, daemon=True).start()
+            self._results.put(output)
+
+    def _pump_results(self) -> None:
+        # Drain everything the worker produced since the last tick into a
+        # single write so N results share one queue append and one insert.
+        chunks: list[str] = []
+        try:
+            while True:
+                chunks.append(self._results.get_nowait())
+        except queue.Empty:
+            pass
+        if chunks:
+            self._write_output("".join(chunks))
+        self.root.after(50, self._pump_results)
 
     # Convenience ------------------------------------------------------
     def mainloop(self) -> None:
@@ -167,72 +575,192 @@ class ApophisIDE:
     # Editing helpers --------------------------------------------------
     def undo(self) -> None:
         """Undo the last edit."""
-        with contextlib.suppress(Exception):
-            self.text.edit_undo()
+        try:
+            self._edit_undo()
+        except TclError:
+            pass
 
     def redo(self) -> None:
         """Redo the last undone edit."""
-        with contextlib.suppress(Exception):
-            self.text.edit_redo()
+        try:
+            self._edit_redo()
+        except TclError:
+            pass
 
     def find_text(self) -> None:
         """Prompt for text and select the first match in the editor."""
         target = simpledialog.askstring("Find", "Find:")
         if not target:
             return
-        start = self.text.search(target, "1.0", END)
-        if start:
-            end = f"{start}+{len(target)}c"
-            self.text.tag_remove("sel", "1.0", END)
-            self.text.tag_add("sel", start, end)
-            self.text.mark_set(INSERT, end)
-            self.text.see(start)
+        self._last_find = target
+        # Tag every occurrence in one pass so the user sees all hits, then
+        # select the first; Tk reports each match length via the count
+        # variable, which stays correct for composed characters.
+        self.text.tag_remove("hit", "1.0", END)
+        count = IntVar()
+        pos = self.text.search(target, "1.0", stopindex=END, count=count, regexp=False)
+        first = pos
+        first_len = count.get() if pos else 0
+        while pos:
+            end = f"{pos}+{count.get()}c"
+            self.text.tag_add("hit", pos, end)
+            pos = self.text.search(target, end, stopindex=END, count=count, regexp=False)
+        if first:
+            self._select_match(first, first_len)
+
+    def find_next(self, _event: object | None = None) -> None:
+        """Jump to the next match of the last search without re-prompting."""
+        if not self._last_find:
+            return
+        count = IntVar()
+        pos = self.text.search(
+            self._last_find,
+            self.text.index(INSERT),
+            stopindex=END,
+            count=count,
+            nocase=False,
+            regexp=False,
+        )
+        if pos:
+            self._select_match(pos, count.get())
+
+    def _select_match(self, pos: str, length: int) -> None:
+        end = f"{pos}+{length}c"
+        self.text.tag_remove("sel", "1.0", END)
+        self.text.tag_add("sel", pos, end)
+        self.text.mark_set(INSERT, end)
+        self.text.see(pos)
 
     def replace_text(self) -> None:
         """Prompt for text and replacement and apply to the buffer."""
         target = simpledialog.askstring("Replace", "Find:")
-        if target is None:
+        if not target:
             return
         replacement = simpledialog.askstring("Replace", "Replace with:")
         if replacement is None:
             return
-        content = self.text.get("1.0", END)
-        new_content = content.replace(target, replacement)
-        if new_content != content:
-            self.text.delete("1.0", END)
-            self.text.insert("1.0", new_content)
-            self.modified = True
-            self.text.edit_modified(True)
-            self.update_status_bar()
+        # Replace matches in place via Tk's own search so only the touched
+        # spans change; tags, marks and the viewport survive, and the buffer
+        # never round-trips through a Python string.  Tk reports each match
+        # length through the count variable, which stays correct even when
+        # the target's character count differs from its index width.
+        # The first search doubles as the no-match short circuit: a miss is
+        # a single C-level scan with no allocation, no state toggles and no
+        # undo bookkeeping.
+        count = IntVar()
+        idx = self.text.search(target, "1.0", stopindex=END, count=count)
+        if not idx:
+            return
+        self.text.configure(autoseparators=False)
+        self.text.edit_separator()
+        while idx:
+            self.text.delete(idx, f"{idx}+{count.get()}c")
+            if replacement:
+                self.text.insert(idx, replacement)
+            idx = self.text.search(
+                target, f"{idx}+{len(replacement)}c", stopindex=END, count=count
+            )
+        self.text.configure(autoseparators=True)
+        self.text.edit_separator()
+        self.modified = True
+        self.text.edit_modified(True)
+        self.update_status_bar()
 
     def update_status_bar(self, _event: object | None = None) -> None:
-        """Update the status bar with the current cursor position."""
-        line, col = self.text.index(INSERT).split(".")
-        self.status.config(text=f"Ln {int(line)}, Col {int(col) + 1}")
+        """Schedule a status bar refresh for the next idle cycle.
+
+        Key and button events arrive far faster than the display needs to
+        change; coalescing through ``after_idle`` means a burst of events
+        results in a single cursor-position query and label update.
+        """
+        if self._status_pending:
+            return
+        self._status_pending = True
+        self.root.after_idle(self._do_update_status_bar)
+
+    def _do_update_status_bar(self) -> None:
+        self._status_pending = False
+        pos = self.text.index(INSERT)
+        if pos == self._last_pos:
+            return
+        self._last_pos = pos
+        dot = pos.index(".")
+        self.status.config(text=self._fmt_status(pos[:dot], int(pos[dot + 1 :]) + 1))
+
+    @staticmethod
+    def _wrap(fn):
+        """Adapt a no-argument command to Tk's event-callback signature.
+
+        A named wrapper rather than an inline lambda so every accelerator
+        shares one code object and profiles under the command's own name.
+        """
+
+        @wraps(fn)
+        def handler(_event: object) -> None:
+            fn()
+
+        return handler
 
+    # Accelerator sequences mapped to the commands they trigger; handlers
+    # taking the event themselves (find_next, update_status_bar) bind
+    # directly without the wrapper.
     def _bind_events(self) -> None:
         self.text.bind("<KeyRelease>", self.update_status_bar)
         self.text.bind("<ButtonRelease>", self.update_status_bar)
-        self.root.bind("<Control-n>", lambda _e: self.new_file())
-        self.root.bind("<Control-o>", lambda _e: self.open_file())
-        self.root.bind("<Control-s>", lambda _e: self.save_file())
-        self.root.bind("<Control-Shift-S>", lambda _e: self.save_file_as())
-        self.root.bind("<Control-r>", lambda _e: self.run_code())
-        self.root.bind("<Control-l>", lambda _e: self.clear_output())
-        self.root.bind("<Control-f>", lambda _e: self.find_text())
-        self.root.bind("<Control-h>", lambda _e: self.replace_text())
+        self.root.bind("<F3>", self.find_next)
+        bindings = {
+            "<Control-n>": self.new_file,
+            "<Control-o>": self.open_file,
+            "<Control-s>": self.save_file,
+            "<Control-Shift-S>": self.save_file_as,
+            "<Control-r>": self.run_code,
+            "<Control-l>": self.clear_output,
+            "<Control-f>": self.find_text,
+            "<Control-h>": self.replace_text,
+        }
+        for sequence, command in bindings.items():
+            self.root.bind(sequence, self._wrap(command))
 
     def _write_output(self, text: str) -> None:
+        # Writes queue up and flush at most every 50 ms, so a burst of small
+        # chunks shares one state toggle and one insert instead of four Tcl
+        # round-trips each.
+        self._out_queue.append(text)
+        if not self._out_flush_scheduled:
+            self._out_flush_scheduled = True
+            self.root.after(50, self._flush_output)
+
+    @contextmanager
+    def _writable_output(self):
+        """Temporarily lift the console's read-only state.
+
+        Every mutation of the output widget needs the same state toggle
+        pair; fusing it here means a batched flush pays for it once no
+        matter how many chunks it carries.
+        """
         self.output.configure(state="normal")
-        self.output.insert(END, text)
-        self.output.see(END)
-        self.output.configure(state="disabled")
+        try:
+            yield
+        finally:
+            self.output.configure(state="disabled")
+
+    def _flush_output(self) -> None:
+        self._out_flush_scheduled = False
+        if not self._out_queue:
+            return
+        text = "".join(self._out_queue)
+        self._out_queue.clear()
+        with self._writable_output():
+            self.output.insert(END, text)
+            lines = int(self.output.index("end-1c").split(".")[0])
+            if lines > self._output_cap:
+                self.output.delete("1.0", f"{lines - self._output_cap}.0")
+            self.output.see(END)
 
     def clear_output(self) -> None:
         """Clear the output console."""
-        self.output.configure(state="normal")
-        self.output.delete("1.0", END)
-        self.output.configure(state="disabled")
+        with self._writable_output():
+            self.output.delete("1.0", END)
 
     def maybe_save(self) -> bool:
         """Prompt to save changes if the buffer has been modified."""
@@ -247,12 +775,40 @@ class ApophisIDE:
 
     def on_close(self) -> None:
         """Handle window close events."""
-        if self.maybe_save():
-            self.root.destroy()
+        if not self.maybe_save():
+            return
+        # Claim any saves still queued behind run jobs: the daemon worker
+        # dies with the process, and waiting for it would freeze the window
+        # behind a long-running program.  Then wait out whatever write the
+        # worker already has in flight *before* flushing the claimed
+        # payloads, so replaces on the same file stay serialised: the
+        # in-flight token is older than anything claimed here, and writing
+        # ours afterwards guarantees the newest snapshot lands last.
+        with self._save_done:
+            pending = [
+                (k, *self._pending_saves.pop(k)) for k in sorted(self._pending_saves)
+            ]
+            while self._claimed_saves:
+                self._save_done.wait()
+        for token, path, content in pending:
+            try:
+                self._write_file_job(path, content, token)
+            except OSError as exc:
+                self._save_failed(path, str(exc))
+                messagebox.showerror("Save failed", f"Could not save {path}: {exc}")
+                return
+        self.root.destroy()
 
     def _on_modified(self, _event: object | None = None) -> None:
+        # <<Modified>> also fires when the flag is cleared by load/save
+        # paths; ignore those, and skip the title round-trip entirely once
+        # the buffer is already known to be dirty.
+        if not self.text.edit_modified():
+            return
+        if self.modified:
+            return
         self.modified = True
-        self.update_title()
+        self.root.after_idle(self.update_title)
 
     def update_title(self) -> None:
         name = self.file_path.name if self.file_path else "Untitled"
@@ -17,6 +17,12 @@ ENCRYPT = [
     125, 82, 69, 111, 107, 78, 58, 35, 63, 71, 34, 105, 64,
 ]
 
+# 256-entry bytes.translate table applying ENCRYPT to the printable ASCII
+# range and mapping every other byte to itself.
+ENCRYPT_TABLE = bytes(
+    ENCRYPT[i - 33] if 33 <= i <= 126 else i for i in range(256)
+)
+
 
 def eval(code: str) -> str:
     """Evaluate a tiny subset of Malbolge programs.
@@ -41,4 +47,4 @@ def eval(code: str) -> str:
     raise NotImplementedError("minimal interpreter only supports 'Q' and '>b'")
 
 
-__all__ = ["ENCRYPT", "eval"]
+__all__ = ["ENCRYPT", "ENCRYPT_TABLE", "eval"]
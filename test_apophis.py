@@ -1,3 +1,5 @@
+import io
+
 import apophis
 import malbolge
 import pytest
@@ -10,11 +12,37 @@ def test_run_malbolge_trivial():
 def test_malbolge_encode():
     text = 'Hello!'
     encoded = apophis.malbolge_encode(text)
+    expected = text.encode('latin-1').translate(malbolge.ENCRYPT_TABLE).decode('latin-1')
+    assert encoded == expected
+
+
+def test_malbolge_encode_wide_chars():
+    text = 'A€!'
     expected = ''.join(
         chr(malbolge.ENCRYPT[ord(ch) - 33]) if 33 <= ord(ch) <= 126 else ch
         for ch in text
     )
-    assert encoded == expected
+    assert apophis.malbolge_encode(text) == expected
+
+
+def test_malbolge_encode_bytes():
+    data = b'Hello!'
+    expected = data.translate(malbolge.ENCRYPT_TABLE)
+    assert apophis.malbolge_encode_bytes(data) == expected
+    assert apophis.malbolge_encode_bytes(bytearray(data)) == expected
+
+
+def test_malbolge_encode_bytes_rejects_str():
+    with pytest.raises(TypeError):
+        apophis.malbolge_encode_bytes('Hello!')
+
+
+def test_encrypt_table_matches_encrypt():
+    for i in range(256):
+        if 33 <= i <= 126:
+            assert malbolge.ENCRYPT_TABLE[i] == malbolge.ENCRYPT[i - 33]
+        else:
+            assert malbolge.ENCRYPT_TABLE[i] == i
 
 
 def test_run_file_default():
@@ -67,6 +95,13 @@ def test_run_ruby_basic():
     assert apophis.run_ruby("print 'hi'") == "hi"
 
 
+def test_run_ruby_direct_stdout_write():
+    # fd-level writes bypass $stdout; they must be captured, not corrupt
+    # the worker's response framing for later snippets.
+    assert apophis.run_ruby("STDOUT.write('sneaky')") == 'sneaky'
+    assert apophis.run_ruby("puts 'ok'") == "ok\n"
+
+
 def test_run_apophis_with_ruby():
     code = ":print('A', end='')\n;print 'B'\n:print('C', end='')"
     assert apophis.run_apophis(code) == "ABC"
@@ -78,6 +113,11 @@ def test_run_apophis_mixed_file(tmp_path):
     assert apophis.run_file(file) == "his"
 
 
+def test_run_apophis_from_file_object():
+    code = ":print('A', end='')\n;print 'B'\n:print('C', end='')\n"
+    assert apophis.run_apophis_from_file(io.StringIO(code)) == "ABC"
+
+
 def test_run_apophis_persistent_env():
     code = ":x = 1\n>b\n:print(x, end='')"
     assert apophis.run_apophis(code) == "s1"
@@ -88,6 +128,11 @@ def test_run_apophis_comments():
     assert apophis.run_apophis(code) == "X"
 
 
+def test_run_apophis_comments_do_not_split_python_segments():
+    code = ":if True:\n# note\n:    print('ok')"
+    assert apophis.run_apophis(code) == "ok\n"
+
+
 def test_repl_persistence():
     inputs = iter([":x = 2", ":print(x)", ""])
 